@@ -402,6 +402,7 @@ const AuthSystem = {
         
         localStorage.removeItem('chatbot-user');
         localStorage.removeItem('chatbot-chats');
+        ChatSocket.disconnect();
         
         const userDropdown = document.getElementById('userDropdown');
         if (userDropdown) {
@@ -473,6 +474,75 @@ const AuthSystem = {
     }
 };
 
+// Chat Socket: one WebSocket that authenticates once and then carries
+// replies for any number of chats, told apart by a per-message id
+const ChatSocket = {
+    url: 'ws://localhost:5000/api/chat/ws',
+    connecting: null,
+    socket: null,
+    pending: new Map(),
+    nextId: 1,
+
+    // Resolves once the server has accepted the token; rejects when the
+    // socket cannot be opened or authentication fails
+    connect() {
+        if (this.connecting) return this.connecting;
+
+        this.connecting = new Promise((resolve, reject) => {
+            const socket = new WebSocket(this.url);
+
+            socket.onopen = () => {
+                socket.send(JSON.stringify({ type: 'auth', token: AppState.token || '' }));
+            };
+
+            socket.onmessage = (e) => {
+                const frame = JSON.parse(e.data);
+                if (frame.type === 'ready') {
+                    this.socket = socket;
+                    resolve(socket);
+                    return;
+                }
+                const handler = this.pending.get(frame.id);
+                if (handler) handler(frame);
+            };
+
+            socket.onclose = () => {
+                this.socket = null;
+                this.connecting = null;
+                reject(new Error('Chat socket closed'));
+
+                // Finish replies that were cut off
+                this.pending.forEach(handler => handler({ type: 'error', message: 'Connection to the AI was lost.' }));
+                this.pending.clear();
+            };
+        });
+
+        return this.connecting;
+    },
+
+    // Send a message and pass each reply event to onEvent(event, data),
+    // the same events as the Server-Sent Events stream
+    async send(message, sessionId, onEvent) {
+        const socket = await this.connect();
+        const id = String(this.nextId++);
+
+        return new Promise(resolve => {
+            this.pending.set(id, (frame) => {
+                onEvent(frame.type, frame);
+                if (frame.type === 'done' || frame.type === 'error') {
+                    this.pending.delete(id);
+                    resolve();
+                }
+            });
+            socket.send(JSON.stringify({ type: 'chat', id, message, sessionId }));
+        });
+    },
+
+    disconnect() {
+        if (this.socket) this.socket.close();
+    }
+};
+
 // Chat System
 const ChatSystem = {
     init() {
@@ -690,7 +760,7 @@ const ChatSystem = {
         this.showTypingIndicator();
         
         // Generate AI response
-       
+        await this.generateAIResponse(userMessage);
         
         // Save chats and re-render history
         this.saveChats();
@@ -711,47 +781,117 @@ const ChatSystem = {
     
         this.showTypingIndicator();
     
-        let response = "No reply from AI.";
+        const aiMessage = {
+            role: 'assistant',
+            content: '',
+            timestamp: new Date().toISOString()
+        };
     
         try {
-            const res = await fetch('http://localhost:5000/api/chat', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                    Authorization: `Bearer ${AppState.token || ''}`
-                },
-                body: JSON.stringify({
-                    message: userMessage.content,
-                    sessionId: AppState.currentChatId
-                })
-            });
+            let socketReady = false;
+            try {
+                await ChatSocket.connect();
+                socketReady = true;
+            } catch (err) {
+                console.warn('ChatSystem: WebSocket unavailable, using HTTP:', err.message);
+            }
+
+            if (socketReady) {
+                // Replies for every chat share one authenticated socket
+                await this.renderStream(aiMessage, onEvent =>
+                    ChatSocket.send(userMessage.content, AppState.currentChatId, onEvent));
+            } else {
+                const res = await fetch('http://localhost:5000/api/chat', {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        Accept: 'text/event-stream',
+                        Authorization: `Bearer ${AppState.token || ''}`
+                    },
+                    body: JSON.stringify({
+                        message: userMessage.content,
+                        sessionId: AppState.currentChatId,
+                        stream: true
+                    })
+                });
     
-            const data = await res.json();
-            response = data.message || "AI didn't respond.";
+                const contentType = res.headers.get('Content-Type') || '';
+    
+                if (res.body && contentType.includes('text/event-stream')) {
+                    await this.renderStream(aiMessage, onEvent => this.readEventStream(res.body, onEvent));
+                } else {
+                    const data = await res.json();
+                    aiMessage.content = data.message || "AI didn't respond.";
+                    this.hideTypingIndicator();
+                    await this.typeMessage(aiMessage);
+                }
+            }
         } catch (err) {
             console.error('AI request failed:', err);
-            response = "There was a problem talking to the AI.";
+            this.hideTypingIndicator();
+            if (!aiMessage.content) {
+                aiMessage.content = "There was a problem talking to the AI.";
+                await this.typeMessage(aiMessage);
+            }
         }
     
-        this.hideTypingIndicator();
-    
-        const aiMessage = {
-            role: 'assistant',
-            content: response,
-            timestamp: new Date().toISOString()
-        };
-    
         const currentChat = AppState.chats.find(c => c.id === AppState.currentChatId);
         if (currentChat) {
             currentChat.messages.push(aiMessage);
-            await this.typeMessage(aiMessage);
         }
-    }
+    },
     
+    // Render tokens as they arrive instead of waiting for the full reply;
+    // readEvents(onEvent) delivers the reply's stream events
+    async renderStream(aiMessage, readEvents) {
+        const textElement = this.createMessageElement(aiMessage);
+        this.hideTypingIndicator();
+    
+        await readEvents((event, data) => {
+            if (event === 'token') {
+                aiMessage.content += data.content;
+                textElement.innerHTML = aiMessage.content.replace(/\n/g, '<br>');
+                this.scrollToBottom();
+            } else if (event === 'error') {
+                aiMessage.content = data.message;
+                textElement.innerHTML = aiMessage.content;
+            }
+        });
+    
+        if (!aiMessage.content) {
+            aiMessage.content = "AI didn't respond.";
+            textElement.innerHTML = aiMessage.content;
+        }
+    },
+    
+    async readEventStream(body, onEvent) {
+        const reader = body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+    
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+    
+            buffer += decoder.decode(value, { stream: true });
+            const frames = buffer.split('\n\n');
+            buffer = frames.pop();
+    
+            frames.forEach(frame => {
+                let event = 'message';
+                let data = '';
+                frame.split('\n').forEach(line => {
+                    if (line.startsWith('event:')) event = line.slice(6).trim();
+                    else if (line.startsWith('data:')) data += line.slice(5).trim();
+                });
+                if (data) onEvent(event, JSON.parse(data));
+            });
+        }
+    },
 
-    async typeMessage(message) {
+    createMessageElement(message) {
         const chatMessages = document.getElementById('chatMessages');
-        if (!chatMessages) return;
+        if (!chatMessages) return document.createElement('div');
         
         const messageElement = document.createElement('div');
         messageElement.className = `message ${message.role}`;
@@ -769,7 +909,11 @@ const ChatSystem = {
         `;
         
         chatMessages.appendChild(messageElement);
-        const textElement = messageElement.querySelector('.message-text');
+        return messageElement.querySelector('.message-text');
+    },
+
+    async typeMessage(message) {
+        const textElement = this.createMessageElement(message);
         
         // Type out the message
         const words = message.content.split(' ');
@@ -0,0 +1,478 @@
+# Load-test and benchmark harness for the backend generated by script.py.
+#
+# Starts a local stub of the OpenAI chat completions API (configurable
+# latency and token rate), optionally starts the generated backend against
+# it, then drives login, chat, history and session endpoints at a fixed
+# concurrency and reports throughput and latency percentiles. Everything
+# runs offline; only a local MongoDB is needed when starting the backend.
+#
+# Examples:
+#   python benchmark.py --backend-dir ./generated/backend --concurrency 20
+#   python benchmark.py --target http://localhost:5000 --stream --json out.json
+#   python benchmark.py --target http://localhost:5000 --compare baseline.json
+import argparse
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import uuid
+from urllib.parse import urlsplit
+
+DEFAULT_MONGODB_URI = "mongodb://127.0.0.1:27017/ai-chatbot-bench"
+PROMPTS = [
+    "Hello! How can you help me?",
+    "Can you explain React hooks?",
+    "Write a short poem about technology",
+    "What is the difference between SQL and NoSQL databases?",
+    "Give me three tips for writing clean code.",
+]
+
+
+# ---------------------------------------------------------------------------
+# Minimal HTTP/1.1 plumbing on asyncio streams (keeps the harness stdlib-only)
+# ---------------------------------------------------------------------------
+
+async def read_head(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+async def iter_body(reader, headers):
+    # Yield the body in the chunks it arrives in (chunked or sized)
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                return
+            chunk = await reader.readexactly(size)
+            await reader.readexactly(2)
+            yield chunk
+    else:
+        length = int(headers.get("content-length", 0))
+        if length:
+            yield await reader.readexactly(length)
+
+
+class HttpClient:
+    # One keep-alive connection, reopened after errors or Connection: close
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.reader = None
+        self.writer = None
+
+    async def close(self):
+        if self.writer:
+            self.writer.close()
+            self.reader = self.writer = None
+
+    async def request(self, method, path, body=None, token=None, on_chunk=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Connection: keep-alive",
+            f"Content-Length: {len(payload)}",
+        ]
+        if body is not None:
+            lines.append("Content-Type: application/json")
+        if token:
+            lines.append(f"Authorization: Bearer {token}")
+
+        try:
+            self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+            await self.writer.drain()
+
+            status_line, headers = await read_head(self.reader)
+            chunks = []
+            async for chunk in iter_body(self.reader, headers):
+                if on_chunk:
+                    on_chunk(chunk)
+                chunks.append(chunk)
+        except (OSError, asyncio.IncompleteReadError):
+            await self.close()
+            raise
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return int(status_line.split()[1]), headers, b"".join(chunks)
+
+
+# ---------------------------------------------------------------------------
+# Stub OpenAI-compatible server
+# ---------------------------------------------------------------------------
+
+class StubLLM:
+    # Answers POST /v1/chat/completions after `latency_ms`, then emits
+    # `reply_tokens` tokens at `tokens_per_sec` (streamed or buffered)
+
+    def __init__(self, latency_ms=300, tokens_per_sec=50, reply_tokens=60):
+        self.latency = latency_ms / 1000
+        self.token_delay = 1 / tokens_per_sec if tokens_per_sec > 0 else 0
+        self.reply_tokens = reply_tokens
+        self.requests = 0
+        self.server = None
+        self.connections = {}
+
+    async def start(self, host="127.0.0.1", port=0):
+        self.server = await asyncio.start_server(self.handle, host, port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return f"http://{host}:{self.port}/v1"
+
+    async def stop(self):
+        self.server.close()
+        for writer in list(self.connections):
+            writer.close()
+        await asyncio.gather(*self.connections.values(), return_exceptions=True)
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                request_line, headers = await read_head(reader)
+                body = b"".join([chunk async for chunk in iter_body(reader, headers)])
+                method, path = request_line.split()[:2]
+                if method == "POST" and path.endswith("/chat/completions"):
+                    await self.complete(writer, json.loads(body or b"{}"))
+                else:
+                    self.send_json(writer, 404, {"error": {"message": "Not found"}})
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connections.pop(writer, None)
+            writer.close()
+
+    def send_json(self, writer, status, payload):
+        data = json.dumps(payload).encode()
+        writer.write(
+            f"HTTP/1.1 {status} OK\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+        )
+
+    async def complete(self, writer, request):
+        self.requests += 1
+        model = request.get("model", "stub-model")
+        prompt_tokens = sum(len(m.get("content", "")) // 4 + 4 for m in request.get("messages", []))
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": self.reply_tokens,
+            "total_tokens": prompt_tokens + self.reply_tokens,
+        }
+        words = [f"word{i} " for i in range(self.reply_tokens)]
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+
+        await asyncio.sleep(self.latency)
+
+        if not request.get("stream"):
+            await asyncio.sleep(self.token_delay * self.reply_tokens)
+            self.send_json(writer, 200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": "".join(words).strip()},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            })
+            return
+
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+
+        def event(payload):
+            data = f"data: {payload}\n\n".encode()
+            writer.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+
+        for word in words:
+            event(json.dumps({
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}],
+            }))
+            await writer.drain()
+            await asyncio.sleep(self.token_delay)
+
+        if (request.get("stream_options") or {}).get("include_usage"):
+            event(json.dumps({
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [],
+                "usage": usage,
+            }))
+        event("[DONE]")
+        writer.write(b"0\r\n\r\n")
+
+
+# ---------------------------------------------------------------------------
+# Load generation
+# ---------------------------------------------------------------------------
+
+class Recorder:
+    def __init__(self):
+        self.samples = {}
+        self.errors = {}
+
+    def add(self, name, seconds, ok=True):
+        self.samples.setdefault(name, []).append(seconds * 1000)
+        if not ok:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+
+def percentile(sorted_values, pct):
+    # Nearest-rank percentile of an already sorted list
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def timed(recorder, name, coro):
+    start = time.perf_counter()
+    try:
+        status, headers, body = await coro
+    except (OSError, asyncio.IncompleteReadError):
+        recorder.add(name, time.perf_counter() - start, ok=False)
+        return None, None, None
+    recorder.add(name, time.perf_counter() - start, ok=200 <= status < 300)
+    return status, headers, body
+
+
+async def virtual_user(index, args, recorder, deadline):
+    client = HttpClient(args.target)
+    email = f"bench{index}@example.com"
+    password = "benchmark-password"
+
+    try:
+        await client.request("POST", "/api/auth/register", {
+            "username": f"bench{index}", "email": email, "password": password,
+        })
+
+        status, _, body = await timed(recorder, "POST /api/auth/login", client.request(
+            "POST", "/api/auth/login", {"email": email, "password": password}
+        ))
+        if status != 200:
+            return
+        token = json.loads(body)["token"]
+
+        session_id = str(uuid.uuid4())
+        turn = 0
+        while time.perf_counter() < deadline and (not args.turns or turn < args.turns):
+            prompt = PROMPTS[(index + turn) % len(PROMPTS)]
+            turn += 1
+
+            if args.stream:
+                start = time.perf_counter()
+                first_token = []
+
+                def on_chunk(chunk):
+                    if not first_token and b"event: token" in chunk:
+                        first_token.append(time.perf_counter() - start)
+
+                status, _, _ = await timed(recorder, "POST /api/chat (stream)", client.request(
+                    "POST", "/api/chat",
+                    {"message": prompt, "sessionId": session_id, "stream": True},
+                    token, on_chunk,
+                ))
+                if first_token:
+                    recorder.add("POST /api/chat (first token)", first_token[0])
+            else:
+                await timed(recorder, "POST /api/chat", client.request(
+                    "POST", "/api/chat", {"message": prompt, "sessionId": session_id}, token
+                ))
+
+            await timed(recorder, "GET /api/chat/history", client.request(
+                "GET", "/api/chat/history?limit=10", token=token
+            ))
+            await timed(recorder, "GET /api/chat/session/:id", client.request(
+                "GET", f"/api/chat/session/{session_id}", token=token
+            ))
+
+            if args.relogin_every and turn % args.relogin_every == 0:
+                await timed(recorder, "POST /api/auth/login", client.request(
+                    "POST", "/api/auth/login", {"email": email, "password": password}
+                ))
+    finally:
+        await client.close()
+
+
+async def wait_for_health(target, timeout=30):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        client = HttpClient(target)
+        try:
+            status, _, _ = await client.request("GET", "/api/health")
+            if status == 200:
+                return
+        except (OSError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            await client.close()
+        await asyncio.sleep(0.25)
+    raise RuntimeError(f"Backend at {target} did not become healthy within {timeout}s")
+
+
+def start_backend(args, llm_url):
+    # Run the generated backend against the stub LLM, with limits lifted so
+    # the benchmark measures the code rather than the rate limiter
+    env = dict(os.environ)
+    env.update({
+        "PORT": str(urlsplit(args.target).port or 5000),
+        "NODE_ENV": "production",
+        "MONGODB_URI": args.mongodb_uri,
+        "OPENAI_API_KEY": "sk-benchmark",
+        "OPENAI_BASE_URL": llm_url,
+        "JWT_SECRET": "benchmark-secret",
+        "RATE_LIMIT_MAX": "100000000",
+        "CHAT_RATE_LIMIT_BURST": "100000000",
+        "CHAT_RATE_LIMIT_PER_MINUTE": "100000000",
+    })
+    entry = "cluster.js" if args.cluster else "server.js"
+    return subprocess.Popen(["node", entry], cwd=args.backend_dir, env=env)
+
+
+def summarize(recorder, elapsed):
+    rows = []
+    for name, samples in sorted(recorder.samples.items()):
+        ordered = sorted(samples)
+        rows.append({
+            "endpoint": name,
+            "requests": len(ordered),
+            "errors": recorder.errors.get(name, 0),
+            "rps": len(ordered) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(ordered, 50),
+            "p90_ms": percentile(ordered, 90),
+            "p99_ms": percentile(ordered, 99),
+            "max_ms": ordered[-1],
+        })
+    return rows
+
+
+def print_report(rows, elapsed, llm):
+    print(f"Duration: {elapsed:.1f}s   Stub LLM calls: {llm.requests}")
+    print()
+    header = f"{'endpoint':<32}{'reqs':>7}{'errs':>6}{'rps':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        print(
+            f"{row['endpoint']:<32}{row['requests']:>7}{row['errors']:>6}{row['rps']:>9.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}"
+        )
+
+
+def compare(rows, baseline_path, tolerance):
+    # Report endpoints whose p50/p99 regressed beyond `tolerance` (a fraction)
+    with open(baseline_path) as f:
+        baseline = {row["endpoint"]: row for row in json.load(f)["results"]}
+
+    regressions = []
+    for row in rows:
+        before = baseline.get(row["endpoint"])
+        if not before:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            if before[metric] and row[metric] > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{row['endpoint']} {metric}: {before[metric]:.1f} -> {row[metric]:.1f} ms"
+                )
+    return regressions
+
+
+async def run(args):
+    llm = StubLLM(args.llm_latency_ms, args.llm_tokens_per_sec, args.llm_reply_tokens)
+    llm_url = await llm.start(port=args.llm_port)
+    print(f"Stub LLM listening on {llm_url}")
+
+    backend = None
+    try:
+        if args.backend_dir:
+            backend = start_backend(args, llm_url)
+        await wait_for_health(args.target)
+
+        recorder = Recorder()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        await asyncio.gather(*(
+            virtual_user(i, args, recorder, deadline) for i in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        try:
+            if backend:
+                backend.terminate()
+                try:
+                    backend.wait(timeout=15)
+                except subprocess.TimeoutExpired:
+                    backend.kill()
+                    backend.wait()
+        finally:
+            await llm.stop()
+
+    rows = summarize(recorder, elapsed)
+    print_report(rows, elapsed, llm)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "elapsed": elapsed, "results": rows}, f, indent=2)
+
+    if args.compare:
+        regressions = compare(rows, args.compare, args.tolerance)
+        if regressions:
+            print()
+            print("REGRESSIONS:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the generated chatbot backend offline")
+    parser.add_argument("--target", default="http://127.0.0.1:5000", help="backend base URL")
+    parser.add_argument("--backend-dir", help="start the generated backend from this directory")
+    parser.add_argument("--cluster", action="store_true", help="start the backend with cluster.js")
+    parser.add_argument("--mongodb-uri", default=DEFAULT_MONGODB_URI)
+    parser.add_argument("--concurrency", type=int, default=10, help="virtual users")
+    parser.add_argument("--duration", type=float, default=30, help="seconds to run")
+    parser.add_argument("--turns", type=int, default=0, help="chat turns per user (0 = until duration)")
+    parser.add_argument("--relogin-every", type=int, default=5, help="log in again every N turns (0 = never)")
+    parser.add_argument("--stream", action="store_true", help="request Server-Sent Events replies")
+    parser.add_argument("--llm-port", type=int, default=0)
+    parser.add_argument("--llm-latency-ms", type=float, default=300)
+    parser.add_argument("--llm-tokens-per-sec", type=float, default=50)
+    parser.add_argument("--llm-reply-tokens", type=int, default=60)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown vs baseline")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(run(parse_args())))
@@ -0,0 +1,411 @@
+# Lightweight static checks for the CommonJS files emitted by script.py.
+#
+# This is not a full JavaScript parser: a tokenizer plus a few pattern rules
+# are enough for the generated code, which sticks to const/let, require(),
+# arrow functions and classes. Scoping is ignored on purpose: a name counts
+# as declared if it is bound anywhere in the file, so the checks only report
+# names that can never resolve (missing requires, typos) and never flag
+# shadowing or hoisting.
+import posixpath
+import re
+
+# Bump when the checks change so cached results are not reused
+CHECKER_VERSION = 2
+
+KEYWORDS = {
+    "async", "await", "break", "case", "catch", "class", "const", "continue",
+    "debugger", "default", "delete", "do", "else", "export", "extends", "false",
+    "finally", "for", "function", "get", "if", "import", "in", "instanceof",
+    "let", "new", "null", "of", "return", "set", "static", "super", "switch",
+    "this", "throw", "true", "try", "typeof", "var", "void", "while", "with",
+    "yield",
+}
+
+NODE_GLOBALS = {
+    "AbortController", "Array", "ArrayBuffer", "BigInt", "Boolean", "Buffer",
+    "Date", "Error", "Function", "Infinity", "Intl", "JSON", "Map", "Math",
+    "NaN", "Number", "Object", "Promise", "Proxy", "RangeError", "Reflect",
+    "RegExp", "Set", "String", "Symbol", "SyntaxError", "TextDecoder",
+    "TextEncoder", "TypeError", "URL", "URLSearchParams", "Uint8Array",
+    "WeakMap", "WeakSet", "__dirname", "__filename", "arguments",
+    "clearImmediate", "clearInterval", "clearTimeout", "console",
+    "decodeURIComponent", "encodeURIComponent", "exports", "fetch",
+    "globalThis", "isFinite", "isNaN", "module", "parseFloat", "parseInt",
+    "process", "queueMicrotask", "require", "setImmediate", "setInterval",
+    "setTimeout", "structuredClone", "undefined",
+}
+
+NODE_BUILTINS = {
+    "assert", "async_hooks", "buffer", "child_process", "cluster", "crypto",
+    "dns", "events", "fs", "fs/promises", "http", "http2", "https", "net", "os",
+    "path", "perf_hooks", "querystring", "readline", "stream", "string_decoder",
+    "timers", "tls", "url", "util", "v8", "vm", "worker_threads", "zlib",
+}
+
+# Built-ins that only resolve with the node: prefix; require('test') loads
+# a package of that name
+NODE_PREFIXED_BUILTINS = {"test"}
+
+# Keywords that take a parenthesized clause before a block; any other
+# name(...) { is a method definition
+BLOCK_KEYWORDS = {"if", "for", "while", "switch", "catch", "function", "with"}
+
+# Tokens after which a "/" starts a regular expression rather than a division
+REGEX_PREFIX_WORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new", "delete", "void", "throw"}
+
+IDENT_START = re.compile(r"[A-Za-z_$]")
+IDENT = re.compile(r"[A-Za-z_$][\w$]*")
+NUMBER = re.compile(r"0[xXbBoO][\da-fA-F_]+n?|\d[\d_]*(\.\d*)?([eE][+-]?\d+)?n?|\.\d+([eE][+-]?\d+)?")
+PUNCTUATORS = sorted([
+    ">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+    "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=",
+    "*=", "/=", "%=", "&=", "|=", "^=", "**", "<<", ">>",
+], key=len, reverse=True)
+
+
+class Token:
+    __slots__ = ("kind", "value", "line")
+
+    def __init__(self, kind, value, line):
+        self.kind = kind
+        self.value = value
+        self.line = line
+
+    def __repr__(self):
+        return f"Token({self.kind}, {self.value!r}, {self.line})"
+
+
+# Split source into ident/num/str/punct tokens, dropping comments. Template
+# literals become a "str" token followed by the tokens of each ${...} part.
+def tokenize(source):
+    tokens = []
+    # Brace depth at which each open template literal resumes
+    templates = []
+    depth = 0
+    i = 0
+    line = 1
+    n = len(source)
+
+    def previous_allows_regex():
+        if not tokens:
+            return True
+        last = tokens[-1]
+        if last.kind in ("num", "str"):
+            return False
+        if last.kind == "ident":
+            return last.value in REGEX_PREFIX_WORDS
+        return last.value not in (")", "]", "}")
+
+    def scan_template(i):
+        # Scan template text from i up to "`" or "${"; returns (end, text, closed)
+        start = i
+        while i < n:
+            ch = source[i]
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == "`":
+                return i + 1, source[start:i], True
+            if ch == "$" and source.startswith("${", i):
+                return i + 2, source[start:i], False
+            i += 1
+        raise SyntaxError(f"line {line}: unterminated template literal")
+
+    while i < n:
+        ch = source[i]
+
+        if ch == "\n":
+            line += 1
+            i += 1
+        elif ch in " \t\r":
+            i += 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = n if end < 0 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            if end < 0:
+                raise SyntaxError(f"line {line}: unterminated comment")
+            line += source.count("\n", i, end)
+            i = end + 2
+        elif ch in "'\"":
+            j = i + 1
+            while j < n and source[j] != ch:
+                if source[j] == "\n":
+                    raise SyntaxError(f"line {line}: unterminated string")
+                j += 2 if source[j] == "\\" else 1
+            tokens.append(Token("str", source[i + 1:j], line))
+            i = j + 1
+        elif ch == "`":
+            end, text, closed = scan_template(i + 1)
+            tokens.append(Token("str", text, line))
+            line += source.count("\n", i, end)
+            i = end
+            if not closed:
+                templates.append(depth)
+                depth += 1
+        elif ch == "}" and templates and templates[-1] == depth - 1:
+            depth -= 1
+            templates.pop()
+            end, text, closed = scan_template(i + 1)
+            line += source.count("\n", i, end)
+            i = end
+            if not closed:
+                templates.append(depth)
+                depth += 1
+        elif ch == "/" and previous_allows_regex():
+            j = i + 1
+            in_class = False
+            while j < n and (in_class or source[j] != "/"):
+                if source[j] == "\n":
+                    raise SyntaxError(f"line {line}: unterminated regular expression")
+                if source[j] == "\\":
+                    j += 1
+                elif source[j] == "[":
+                    in_class = True
+                elif source[j] == "]":
+                    in_class = False
+                j += 1
+            j += 1
+            while j < n and source[j].isalpha():
+                j += 1
+            tokens.append(Token("regex", source[i:j], line))
+            i = j
+        elif IDENT_START.match(ch):
+            match = IDENT.match(source, i)
+            tokens.append(Token("ident", match.group(), line))
+            i = match.end()
+        elif ch.isdigit() or (ch == "." and i + 1 < n and source[i + 1].isdigit()):
+            match = NUMBER.match(source, i)
+            tokens.append(Token("num", match.group(), line))
+            i = match.end()
+        else:
+            value = next((p for p in PUNCTUATORS if source.startswith(p, i)), ch)
+            if value in "{([":
+                depth += 1
+            elif value in "})]":
+                depth -= 1
+            tokens.append(Token("punct", value, line))
+            i += len(value)
+
+    return tokens
+
+
+def is_punct(token, value):
+    return token is not None and token.kind == "punct" and token.value == value
+
+
+# Index of the bracket closing the one at tokens[start]
+def matching(tokens, start):
+    opening = tokens[start].value
+    closing = {"(": ")", "[": "]", "{": "}"}[opening]
+    depth = 0
+    for index in range(start, len(tokens)):
+        token = tokens[index]
+        if token.kind == "punct":
+            if token.value in "([{":
+                depth += 1
+            elif token.value in ")]}":
+                depth -= 1
+                if depth == 0:
+                    if token.value != closing:
+                        raise SyntaxError(f"line {token.line}: expected '{closing}'")
+                    return index
+    raise SyntaxError(f"line {tokens[start].line}: unclosed '{opening}'")
+
+
+# Names bound by a declaration pattern starting at tokens[start]
+# (identifier, object or array destructuring); returns (names, end index)
+def binding_names(tokens, start):
+    token = tokens[start]
+    if token.kind == "ident":
+        return [token.value], start + 1
+    if not (is_punct(token, "{") or is_punct(token, "[")):
+        return [], start + 1
+
+    end = matching(tokens, start)
+    names = []
+    index = start + 1
+    while index < end:
+        token = tokens[index]
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+        if token.kind == "ident" and is_punct(following, ":"):
+            # { key: pattern } binds the pattern, not the key
+            index += 2
+            continue
+        if token.kind == "ident" and not is_punct(tokens[index - 1], "="):
+            names.append(token.value)
+        elif is_punct(token, "{") or is_punct(token, "["):
+            nested, index = binding_names(tokens, index)
+            names.extend(nested)
+            continue
+        elif is_punct(token, "="):
+            # Skip a default value up to the next element
+            depth = 0
+            index += 1
+            while index < end:
+                value = tokens[index].value if tokens[index].kind == "punct" else None
+                if value in ("(", "[", "{"):
+                    depth += 1
+                elif value in (")", "]", "}"):
+                    depth -= 1
+                elif value == "," and depth == 0:
+                    break
+                index += 1
+            continue
+        index += 1
+    return names, end + 1
+
+
+# Every name bound anywhere in the file, plus the indexes of identifier
+# tokens that are definitions or property names rather than references
+def collect_bindings(tokens):
+    declared = set()
+    not_references = set()
+
+    def declare_group(open_index):
+        # Parameters: every identifier in the parentheses that is not a
+        # property access or an object key
+        close = matching(tokens, open_index)
+        for index in range(open_index + 1, close):
+            token = tokens[index]
+            if token.kind != "ident":
+                continue
+            if is_punct(tokens[index - 1], ".") or is_punct(tokens[index - 1], "?."):
+                continue
+            if is_punct(tokens[index + 1], ":"):
+                not_references.add(index)
+                continue
+            declared.add(token.value)
+            not_references.add(index)
+        return close
+
+    for index, token in enumerate(tokens):
+        following = tokens[index + 1] if index + 1 < len(tokens) else None
+
+        if token.kind == "ident" and token.value in ("const", "let", "var"):
+            position = index + 1
+            while position < len(tokens):
+                names, position = binding_names(tokens, position)
+                declared.update(names)
+                # Skip the initializer; another declarator follows a
+                # top-level comma on the same statement
+                depth = 0
+                while position < len(tokens):
+                    current = tokens[position]
+                    if current.kind == "punct":
+                        if current.value in "([{":
+                            depth += 1
+                        elif current.value in ")]}":
+                            depth -= 1
+                            if depth < 0:
+                                break
+                        elif depth == 0 and current.value in (",", ";"):
+                            break
+                    if depth == 0 and position > index + 1 and current.line != tokens[position - 1].line \
+                            and tokens[position - 1].kind != "punct":
+                        break
+                    position += 1
+                if position < len(tokens) and is_punct(tokens[position], ",") and depth == 0:
+                    position += 1
+                    continue
+                break
+
+        elif token.kind == "ident" and token.value in ("function", "class"):
+            if following is not None and following.kind == "ident" and following.value != "extends":
+                declared.add(following.value)
+                not_references.add(index + 1)
+            if token.value == "function":
+                open_index = index + (2 if following is not None and following.kind == "ident" else 1)
+                if is_punct(tokens[open_index], "("):
+                    declare_group(open_index)
+
+        elif token.kind == "ident" and token.value == "catch" and is_punct(following, "("):
+            declare_group(index + 1)
+
+        elif token.kind == "ident" and is_punct(following, "=>"):
+            declared.add(token.value)
+            not_references.add(index)
+
+        elif is_punct(token, "("):
+            close = matching(tokens, index)
+            after = tokens[close + 1] if close + 1 < len(tokens) else None
+            before = tokens[index - 1] if index > 0 else None
+            if is_punct(after, "=>"):
+                declare_group(index)
+            elif is_punct(after, "{") and before is not None and before.kind == "ident" \
+                    and before.value not in BLOCK_KEYWORDS and not is_punct(tokens[index - 2], "."):
+                # Method definition: name(params) { ... }
+                not_references.add(index - 1)
+                declare_group(index)
+
+        elif token.kind == "ident" and is_punct(following, ":"):
+            before = tokens[index - 1] if index > 0 else None
+            if is_punct(before, "{") or is_punct(before, ","):
+                not_references.add(index)
+
+    return declared, not_references
+
+
+def undefined_names(tokens):
+    declared, not_references = collect_bindings(tokens)
+    problems = {}
+    for index, token in enumerate(tokens):
+        if token.kind != "ident" or index in not_references:
+            continue
+        name = token.value
+        if name in KEYWORDS or name in declared or name in NODE_GLOBALS:
+            continue
+        if index > 0 and (is_punct(tokens[index - 1], ".") or is_punct(tokens[index - 1], "?.")):
+            continue
+        problems.setdefault(name, token.line)
+    return problems
+
+
+# Module names passed to require('...') with a literal argument
+def required_modules(tokens):
+    for index, token in enumerate(tokens[:-3]):
+        if token.kind == "ident" and token.value == "require" and is_punct(tokens[index + 1], "(") \
+                and tokens[index + 2].kind == "str" and is_punct(tokens[index + 3], ")"):
+            yield tokens[index + 2].value, token.line
+
+
+def package_name(module):
+    parts = module.split("/")
+    return "/".join(parts[:2]) if module.startswith("@") else parts[0]
+
+
+# Check one generated file. `package` is the generated package.json that owns
+# it (or None) and `paths` the set of all generated file paths. Returns a
+# list of "path:line: message" strings.
+def check_file(path, source, package, paths):
+    try:
+        tokens = tokenize(source)
+    except SyntaxError as error:
+        return [f"{path}: syntax error: {error}"]
+
+    problems = []
+    dependencies = (package or {}).get("dependencies", {})
+    dev_dependencies = (package or {}).get("devDependencies", {})
+
+    for module, line in required_modules(tokens):
+        if module.startswith("."):
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(path), module))
+            candidates = (target, target + ".js", target + ".json", target + "/index.js")
+            if not any(candidate in paths for candidate in candidates):
+                problems.append(f"{path}:{line}: require('{module}') does not match a generated file")
+            continue
+        name = module[5:] if module.startswith("node:") else module
+        if name in NODE_BUILTINS or package_name(name) in NODE_BUILTINS:
+            continue
+        if module.startswith("node:") and name in NODE_PREFIXED_BUILTINS:
+            continue
+        if package_name(module) in dependencies:
+            continue
+        where = "devDependencies only" if package_name(module) in dev_dependencies else "dependencies"
+        problems.append(f"{path}:{line}: require('{module}') is not listed in package.json {where}")
+
+    for name, line in sorted(undefined_names(tokens).items(), key=lambda item: item[1]):
+        problems.append(f"{path}:{line}: '{name}' is not defined")
+
+    return problems